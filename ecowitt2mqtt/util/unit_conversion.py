@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 
 from ecowitt2mqtt.const import (
     ACCUMULATED_PRECIPITATION,
@@ -140,7 +141,7 @@ class BaseUnitConverter:
             UnitConversionError: Raised when a unit cannot be recognized.
         """
         if from_unit == to_unit:
-            return value
+            return float(value)
 
         for unit in (from_unit, to_unit):
             if unit in cls.VALID_UNITS:
@@ -156,9 +157,13 @@ class BaseUnitConverter:
         return cls._trim_value_precision_to_ratio(value, from_unit, to_unit)
 
     @classmethod
+    @lru_cache(maxsize=256)
     def get_unit_ratio(cls, from_unit: str, to_unit: str) -> float:
         """Get unit ratio between units of measurement.
 
+        Ratios are cached per converter class and unit pair, since the set of units is
+        small and fixed.
+
         Args:
             from_unit: The unit we are converting from.
             to_unit: The unit we are converting to.
@@ -248,7 +253,7 @@ class IlluminanceConverter(BaseUnitConverter):
             A converted value.
         """
         if from_unit == to_unit:
-            return value
+            return float(value)
 
         if from_unit == PERCENTAGE:
             lux = pow(10, value / 20)
@@ -424,7 +429,7 @@ class TemperatureConverter(BaseUnitConverter):
             UnitConversionError: Raised when a unit cannot be recognized.
         """
         if from_unit == to_unit:
-            return value
+            return float(value)
 
         for unit in (from_unit, to_unit):
             if unit in cls.VALID_UNITS:
@@ -1,4 +1,6 @@
 """Test unit conversion helpers."""
+import math
+
 import pytest
 
 from ecowitt2mqtt.util.unit_conversion import (
@@ -14,35 +16,19 @@ from ecowitt2mqtt.util.unit_conversion import (
     VolumeConverter,
 )
 
+# Expected values shared by more than one row:
+_TEN_MM_IN_INCHES = 0.39370078740157477
+_264_61_WM2_AS_PERCENTAGE = 90.49958322993245
 
-@pytest.mark.parametrize(
-    "value,from_unit,to_unit,converted_value",
-    [
+_CASES_BY_CONVERTER: dict[
+    type[BaseUnitConverter], list[tuple[float, str, str, float]]
+] = {
+    AccumulatedPrecipitationConverter: [
         (10, "mm", "mm", 10.0),
         (10, "in", "mm", 254.0),
-        (10, "mm", "in", 0.39370078740157477),
+        (10, "mm", "in", _TEN_MM_IN_INCHES),
     ],
-)
-def test_accumulated_precipitation_conversion(
-    converted_value: float, from_unit: str, to_unit: str, value: float
-) -> None:
-    """Test accumulated precipitation conversions.
-
-    Args:
-        converted_value: The converted value.
-        from_unit: The unit being converted from.
-        to_unit: The unit being converted to.
-        value: The original value:
-    """
-    assert (
-        AccumulatedPrecipitationConverter.convert(value, from_unit, to_unit)
-        == converted_value
-    )
-
-
-@pytest.mark.parametrize(
-    "value,from_unit,to_unit,converted_value",
-    [
+    DistanceConverter: [
         (10, "km", "km", 10.0),
         (10, "km", "mi", 6.21371192237334),
         (10, "km", "ft", 32808.39895013124),
@@ -52,24 +38,7 @@ def test_accumulated_precipitation_conversion(
         (10, "km", "in", 393700.78740157484),
         (10, "km", "yd", 10936.13298337708),
     ],
-)
-def test_distance_conversion(
-    converted_value: float, from_unit: str, to_unit: str, value: float
-) -> None:
-    """Test distance conversions.
-
-    Args:
-        converted_value: The converted value.
-        from_unit: The unit being converted from.
-        to_unit: The unit being converted to.
-        value: The original value:
-    """
-    assert DistanceConverter.convert(value, from_unit, to_unit) == converted_value
-
-
-@pytest.mark.parametrize(
-    "value,from_unit,to_unit,converted_value",
-    [
+    IlluminanceConverter: [
         (10, "lx", "lx", 10.0),
         (10, "lx", "fc", 0.9290312990644656),
         (10, "lx", "kfc", 0.0009290312990644657),
@@ -78,80 +47,16 @@ def test_distance_conversion(
         (10, "W/m²", "lx", 1265.8227848101264),
         (10, "fc", "lx", 107.639),
         (10, "fc", "klx", 0.107639),
-        (264.61, "W/m²", "%", 90.49958322993245),
-        (90.49958322993245, "%", "W/m²", 264.61000000000007),
+        (264.61, "W/m²", "%", _264_61_WM2_AS_PERCENTAGE),
+        (_264_61_WM2_AS_PERCENTAGE, "%", "W/m²", 264.61000000000007),
         (90.0, "%", "%", 90.0),
     ],
-)
-def test_illuminance_conversion(
-    converted_value: float, from_unit: str, to_unit: str, value: float
-) -> None:
-    """Test illuminance conversions.
-
-    Args:
-        converted_value: The converted value.
-        from_unit: The unit being converted from.
-        to_unit: The unit being converted to.
-        value: The original value:
-    """
-    assert IlluminanceConverter.convert(value, from_unit, to_unit) == converted_value
-
-
-@pytest.mark.parametrize(
-    "unit_class,converter,from_unit,to_unit",
-    [
-        ("accumulated_precipitation", AccumulatedPrecipitationConverter, "in", "yd"),
-        ("accumulated_precipitation", AccumulatedPrecipitationConverter, "mm", "dm"),
-        ("distance", DistanceConverter, "m", "dm"),
-        ("distance", DistanceConverter, "miles", "ft"),
-        ("illuminance", IlluminanceConverter, "lx", "bulbs"),
-        ("illuminance", IlluminanceConverter, "sunbeams", "klx"),
-        ("pressure", PressureConverter, "hPa", "hPa/s"),
-        ("pressure", PressureConverter, "units", "hPa"),
-        ("speed", SpeedConverter, "km/d", "m/s"),
-        ("speed", SpeedConverter, "mph", "km/s"),
-        ("temperature", TemperatureConverter, "Fake", "°C"),
-        ("temperature", TemperatureConverter, "°C", "Bolts"),
-        ("volume", VolumeConverter, "g/km³", "lbs/ft³"),
-        ("volume", VolumeConverter, "g/m³", "sparrows"),
-    ],
-)
-def test_invalid_units(
-    converter: type[BaseUnitConverter], from_unit: str, to_unit: str, unit_class: str
-) -> None:
-    """Test that invalid units raise an error."""
-    with pytest.raises(UnitConversionError) as err:
-        _ = converter.convert(10, from_unit, to_unit)
-        assert f"is not a recognized {unit_class} unit" in str(err)
-
-
-@pytest.mark.parametrize(
-    "value,from_unit,to_unit,converted_value",
-    [
+    PrecipitationRateConverter: [
         (10, "mm/h", "mm/h", 10.0),
         (10, "in/h", "mm/h", 254.0),
-        (10, "mm/h", "in/h", 0.39370078740157477),
+        (10, "mm/h", "in/h", _TEN_MM_IN_INCHES),
     ],
-)
-def test_precipitation_rate_conversion(
-    converted_value: float, from_unit: str, to_unit: str, value: float
-) -> None:
-    """Test precipitation rate conversions.
-
-    Args:
-        converted_value: The converted value.
-        from_unit: The unit being converted from.
-        to_unit: The unit being converted to.
-        value: The original value:
-    """
-    assert (
-        PrecipitationRateConverter.convert(value, from_unit, to_unit) == converted_value
-    )
-
-
-@pytest.mark.parametrize(
-    "value,from_unit,to_unit,converted_value",
-    [
+    PressureConverter: [
         (10, "bar", "Pa", 999999.9999999999),
         (10, "cbar", "Pa", 10000.0),
         (10, "hPa", "Pa", 1000.0),
@@ -163,24 +68,7 @@ def test_precipitation_rate_conversion(
         (10, "Pa", "psi", 0.0014503774389728313),
         (10, "inHg", "cbar", 33.86388640341),
     ],
-)
-def test_pressure_conversion(
-    converted_value: float, from_unit: str, to_unit: str, value: float
-) -> None:
-    """Test pressure conversions.
-
-    Args:
-        converted_value: The converted value.
-        from_unit: The unit being converted from.
-        to_unit: The unit being converted to.
-        value: The original value:
-    """
-    assert PressureConverter.convert(value, from_unit, to_unit) == converted_value
-
-
-@pytest.mark.parametrize(
-    "value,from_unit,to_unit,converted_value",
-    [
+    SpeedConverter: [
         (10, "ft/s", "m/s", 3.0479999999999996),
         (1000, "in/d", "m/s", 0.00029398148148148144),
         (100, "in/h", "m/s", 0.0007055555555555556),
@@ -192,24 +80,7 @@ def test_pressure_conversion(
         (1, "m/s", "in/d", 3401574.8031496066),
         (10, "in/h", "km/h", 0.000254),
     ],
-)
-def test_speed_conversion(
-    converted_value: float, from_unit: str, to_unit: str, value: float
-) -> None:
-    """Test speed conversions.
-
-    Args:
-        converted_value: The converted value.
-        from_unit: The unit being converted from.
-        to_unit: The unit being converted to.
-        value: The original value:
-    """
-    assert SpeedConverter.convert(value, from_unit, to_unit) == converted_value
-
-
-@pytest.mark.parametrize(
-    "value,from_unit,to_unit,converted_value",
-    [
+    TemperatureConverter: [
         (20, "°C", "°C", 20.0),
         (20, "°C", "°F", 68.0),
         (10, "°C", "K", 283.15),
@@ -218,19 +89,67 @@ def test_speed_conversion(
         (200, "K", "°C", -73.14999999999998),
         (350, "K", "°F", 170.33000000000004),
     ],
+    VolumeConverter: [
+        (10, "g/m³", "lbs/ft³", 0.0006242796057614459),
+        (10, "lbs/ft³", "g/m³", 160184.63373960144),
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    "converter",
+    list(_CASES_BY_CONVERTER),
+    ids=lambda converter: converter.__name__,
 )
-def test_temperature_conversion(
-    converted_value: float, from_unit: str, to_unit: str, value: float
-) -> None:
-    """Test temperature conversions.
+def test_conversion_family(converter: type[BaseUnitConverter]) -> None:
+    """Test every conversion for a converter.
 
     Args:
-        converted_value: The converted value.
-        from_unit: The unit being converted from.
-        to_unit: The unit being converted to.
-        value: The original value:
+        converter: A BaseUnitConverter subclass.
     """
-    assert TemperatureConverter.convert(value, from_unit, to_unit) == converted_value
+    for value, from_unit, to_unit, converted_value in _CASES_BY_CONVERTER[converter]:
+        result = converter.convert(value, from_unit, to_unit)
+        message = f"{value} {from_unit}->{to_unit}"
+
+        if from_unit == to_unit:
+            # Identity conversions short-circuit, so they should come back as an exact
+            # float:
+            assert isinstance(result, float), message
+            assert result == converted_value, message
+            continue
+
+        # Temperature conversions apply an offset, which can cost a few extra ULPs:
+        rel_tol = 1e-10 if converter is TemperatureConverter else 1e-12
+        assert math.isclose(result, converted_value, rel_tol=rel_tol), message
+
+
+@pytest.mark.parametrize(
+    "unit_class,converter,from_unit,to_unit",
+    [
+        ("accumulated_precipitation", AccumulatedPrecipitationConverter, "in", "yd"),
+        ("accumulated_precipitation", AccumulatedPrecipitationConverter, "mm", "dm"),
+        ("length", DistanceConverter, "m", "dm"),
+        ("length", DistanceConverter, "miles", "ft"),
+        ("illuminance", IlluminanceConverter, "lx", "bulbs"),
+        ("illuminance", IlluminanceConverter, "sunbeams", "klx"),
+        ("pressure", PressureConverter, "hPa", "hPa/s"),
+        ("pressure", PressureConverter, "units", "hPa"),
+        ("speed", SpeedConverter, "km/d", "m/s"),
+        ("speed", SpeedConverter, "mph", "km/s"),
+        ("temperature", TemperatureConverter, "Fake", "°C"),
+        ("temperature", TemperatureConverter, "°C", "Bolts"),
+        ("volume", VolumeConverter, "g/km³", "lbs/ft³"),
+        ("volume", VolumeConverter, "g/m³", "sparrows"),
+    ],
+)
+def test_invalid_units(
+    converter: type[BaseUnitConverter], from_unit: str, to_unit: str, unit_class: str
+) -> None:
+    """Test that invalid units raise an error."""
+    with pytest.raises(
+        UnitConversionError, match=f"is not a recognized {unit_class} unit"
+    ):
+        _ = converter.convert(10, from_unit, to_unit)
 
 
 @pytest.mark.parametrize(
@@ -258,24 +177,3 @@ def test_unit_ratio(
         ratio: The unit ratio.
     """
     assert converter.get_unit_ratio(from_unit, to_unit) == ratio
-
-
-@pytest.mark.parametrize(
-    "value,from_unit,to_unit,converted_value",
-    [
-        (10, "g/m³", "lbs/ft³", 0.0006242796057614459),
-        (10, "lbs/ft³", "g/m³", 160184.63373960144),
-    ],
-)
-def test_volume_conversion(
-    converted_value: float, from_unit: str, to_unit: str, value: float
-) -> None:
-    """Test volume conversions.
-
-    Args:
-        converted_value: The converted value.
-        from_unit: The unit being converted from.
-        to_unit: The unit being converted to.
-        value: The original value:
-    """
-    assert VolumeConverter.convert(value, from_unit, to_unit) == converted_value